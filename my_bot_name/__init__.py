@@ -1,14 +1,24 @@
+import atexit
+import copy
 import datetime
 import logging
 import os
+import queue
 import sys
-from argparse import ArgumentParser
 from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from types import MappingProxyType
 from typing import Callable
 
+import orjson
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available, fall back to the pure-Python loader
+    from yaml import SafeLoader
+
 PACKAGE_LOCATION = Path(os.path.dirname(__file__))
 ROOT_LOCATION = PACKAGE_LOCATION.parent
 RESOURCES_LOCATION = PACKAGE_LOCATION / "resources"
@@ -17,35 +27,49 @@ CONFIG_LOCATION = RESOURCES_LOCATION / "config"
 LOGGER_NAME = "common"
 LOGGING_FORMAT = "%(asctime)s | %(levelname)-8s | %(module)-20s| %(message)s"
 
+# Parsed config files, keyed by (path, mtime) so an edited file is parsed again
+_CONFIG_CACHE: dict[tuple[str, int], dict] = {}
+
 
 def _init_logger():
-    """It sets the format of Python root logger"""
+    """
+    It sets the format of Python root logger.
+    Records are pushed to a queue and written by a background listener, so logging never
+    blocks the caller. The file handler is only added when LOG_TO_FILE=1.
+    """
     formatter = logging.Formatter(LOGGING_FORMAT)
 
     # Create stream handler for stdout with INFO level
     stream_handler = logging.StreamHandler(sys.stdout)
     stream_handler.setFormatter(formatter)
     stream_handler.setLevel(logging.INFO)
-
-    # Create logs directory if it doesn't exist
-    logs_dir = ROOT_LOCATION / "logs"
-    logs_dir.mkdir(exist_ok=True)
-
-    # Create file handler with timestamp in filename and DEBUG level
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = logs_dir / f"my_bot_name_{timestamp}.log"
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setFormatter(formatter)
-    file_handler.setLevel(logging.DEBUG)
-
-    # Setup logger with both handlers
+    handlers = [stream_handler]
+
+    if os.environ.get("LOG_TO_FILE") == "1":
+        # Create logs directory if it doesn't exist
+        logs_dir = ROOT_LOCATION / "logs"
+        logs_dir.mkdir(exist_ok=True)
+
+        # Create file handler with timestamp in filename and DEBUG level
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        log_file = logs_dir / f"my_bot_name_{timestamp}.log"
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        file_handler.setLevel(logging.DEBUG)
+        handlers.append(file_handler)
+
+    # Setup logger with a queue handler, the listener dispatches to the real handlers
+    log_queue = queue.SimpleQueue()
     logger = logging.getLogger(LOGGER_NAME)
-    logger.addHandler(stream_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(QueueHandler(log_queue))
 
     # Set logger level to DEBUG so file handler can receive debug messages
     logger.setLevel(logging.DEBUG)
 
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
 
 _init_logger()
 logger = logging.getLogger(LOGGER_NAME)
@@ -53,59 +77,101 @@ logger = logging.getLogger(LOGGER_NAME)
 
 def log(func: Callable):
     """Decorator to log function calls on start and end"""
+    func_name = func.__name__
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        func_name = func.__name__
+        try:
+            logger.info("Calling function '%s'", func_name)
+            return func(*args, **kwargs)
+
+        except Exception as e:
+            logger.error("Error in function '%s': %s", func_name, e)
+            raise e
 
+    return wrapper
+
+
+def alog(func: Callable):
+    """Decorator to log coroutine function calls on start and end"""
+    func_name = func.__name__
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
         try:
-            logger.info(f"Calling function '{func_name}'")
-            result = func(*args, **kwargs)
-            return result
+            logger.info("Calling function '%s'", func_name)
+            return await func(*args, **kwargs)
 
         except Exception as e:
-            logger.error(f"Error in function '{func_name}': {str(e)}")
+            logger.error("Error in function '%s': %s", func_name, e)
             raise e
 
     return wrapper
 
 
 def _get_config_dict(env: str) -> dict:
-    """Get the config dictionary from resource file"""
+    """
+    Get the config dictionary from resource file (cached per file modification time).
+    The JSON file compiled by scripts/build_config.py is preferred, unless the YAML
+    file was modified after it (e.g. a stale JSON file left over in development).
+    """
 
-    with open(os.path.join(CONFIG_LOCATION, "{}.yml".format(env))) as f:
-        configmap = yaml.load(f, Loader=yaml.SafeLoader)
-    return configmap if configmap else {}
+    yml_path = os.path.join(CONFIG_LOCATION, "{}.yml".format(env))
+    json_path = os.path.join(CONFIG_LOCATION, "{}.json".format(env))
+    yml_mtime = os.stat(yml_path).st_mtime_ns if os.path.exists(yml_path) else None
+    json_mtime = os.stat(json_path).st_mtime_ns if os.path.exists(json_path) else None
+
+    if json_mtime is not None and (yml_mtime is None or json_mtime >= yml_mtime):
+        path, mtime = json_path, json_mtime
+    elif yml_mtime is not None:
+        path, mtime = yml_path, yml_mtime
+    else:
+        raise FileNotFoundError(f"No config file found for environment '{env}'")
+
+    key = (path, mtime)
+    if key not in _CONFIG_CACHE:
+        if path.endswith(".json"):
+            with open(path, "rb") as f:
+                configmap = orjson.loads(f.read())
+        else:
+            with open(path) as f:
+                configmap = yaml.load(f, Loader=SafeLoader)
+        _CONFIG_CACHE[key] = configmap if configmap else {}
+    return _CONFIG_CACHE[key]
 
 
 def _get_env() -> str:
     """Get the environment (first from command line, otherwise from env variable, otherwise local)"""
 
-    parser = ArgumentParser()
-    parser.add_argument(
-        "-e",
-        "--environment",
-        default=os.environ.get("ENVIRONMENT", "local"),
-        help="environment",
-    )
-    args, _ = parser.parse_known_args()
-    return args.environment
+    argv = sys.argv
+    for i, arg in enumerate(argv):
+        if arg in ("-e", "--environment") and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith("--environment="):
+            return arg.split("=", 1)[1]
+    return os.environ.get("ENVIRONMENT", "local")
 
 
 def _deep_merge(dict1, dict2):
     """
-    Recursively merge dictionaries.
+    Merge dict2 into dict1 in place and return dict1.
     Values in dict2 override those in dict1 unless both values are dicts,
-    in which case they are recursively merged.
+    in which case they are merged as well.
     """
-    result = dict1.copy()
-    for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
-    return result
+    stack = [(dict1, dict2)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict) and isinstance(target.get(key), dict):
+                stack.append((target[key], value))
+            else:
+                target[key] = value
+    return dict1
 
 
 environment = _get_env()
-config = _deep_merge(_get_config_dict("default"), _get_config_dict(environment))
+config = MappingProxyType(
+    _deep_merge(
+        copy.deepcopy(_get_config_dict("default")), _get_config_dict(environment)
+    )
+)
@@ -1,7 +1,18 @@
+import importlib.util
+import os
+
 import uvicorn
 
-from my_bot_name.app import app
 from my_bot_name.configurations import API_CONFIG
 
 if __name__ == "__main__":
-    uvicorn.run(app=app, port=API_CONFIG.port, host=API_CONFIG.host)
+    # The app is passed as an import string so that every worker can import it
+    uvicorn.run(
+        app="my_bot_name.app:app",
+        port=API_CONFIG.port,
+        host=API_CONFIG.host,
+        # uvloop is not available on every platform (e.g. Windows)
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "auto",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1)),
+    )
@@ -1,8 +1,15 @@
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from my_bot_name.routers import alive, health
+from my_bot_name.utils.batcher import Batcher
 
 
 class UnicornException(Exception):
@@ -10,6 +17,73 @@ class UnicornException(Exception):
         self.name = name
 
 
+async def _insert_rows_batch(
+    items: List[Tuple[str, str, dict]],
+) -> List[Optional[Exception]]:
+    """
+    Insert the (dataset_id, table_id, row) items of a batch, one INSERT per table.
+    Tables are inserted independently and invalid rows are left out, so an error is
+    only returned to the items it actually concerns.
+    """
+    # Imported here so that workers do not load pandas and BigQuery on startup
+    from my_bot_name.connectors.gcp.bigquery import (
+        PartialInsertError,
+        bigquery_connector,
+    )
+
+    indexes_by_table: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+    for index, (dataset_id, table_id, _) in enumerate(items):
+        indexes_by_table[(dataset_id, table_id)].append(index)
+
+    results: List[Optional[Exception]] = [None] * len(items)
+
+    async def insert_table(dataset_id: str, table_id: str, indexes: List[int]) -> None:
+        try:
+            rows = [items[index][2] for index in indexes]
+            errors = await bigquery_connector.validate_rows_async(
+                dataset_id, table_id, rows
+            )
+            for index, error in zip(indexes, errors):
+                results[index] = error
+
+            valid = [index for index, error in zip(indexes, errors) if error is None]
+            if valid:
+                await bigquery_connector.insert_rows_async(
+                    dataset_id, table_id, [items[index][2] for index in valid]
+                )
+        except PartialInsertError as e:
+            # The first rows are committed, only the others failed
+            for index in valid[e.inserted_rows :]:
+                results[index] = e
+        except Exception as e:
+            for index in indexes:
+                results[index] = results[index] or e
+
+    await asyncio.gather(
+        *(
+            insert_table(dataset_id, table_id, indexes)
+            for (dataset_id, table_id), indexes in indexes_by_table.items()
+        )
+    )
+    return results
+
+
+# Coalesces the rows inserted by concurrent requests (e.g. analytics events):
+# submit (dataset_id, table_id, row) and await it. A row waits at most 100 ms for its
+# batch, then for the INSERT itself (seconds for BigQuery DML), up to 4 run at once
+bq_insert_batcher = Batcher(
+    _insert_rows_batch, max_batch=500, max_wait_ms=100, max_concurrency=4
+)
+
+
+@asynccontextmanager
+async def lifespan(app_: FastAPI):
+    """Start the downstream batchers on startup and flush them on shutdown"""
+    await bq_insert_batcher.start()
+    yield
+    await bq_insert_batcher.stop()
+
+
 def get_app():
     """
     Create and configure a FastAPI application
@@ -18,7 +92,7 @@ def get_app():
         FastAPI: A configured instance of the FastAPI application.
 
     """
-    app_ = FastAPI()
+    app_ = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
     # Configurazione CORS
     app_.add_middleware(
@@ -33,6 +107,9 @@ def get_app():
         max_age=600,  # Tempo in secondi per cui il browser può cachare la risposta del preflight
     )
 
+    # Compressione delle risposte più grandi di 1 KB
+    app_.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     app_.include_router(router=alive.router)
     app_.include_router(router=health.router)
 
@@ -44,7 +121,7 @@ app = get_app()
 
 @app.exception_handler(UnicornException)
 async def unicorn_exception_handler(request: Request, exc: UnicornException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=418,
         content={"message": f"Oops! {exc.name} did something. There goes a raibow..."},
     )
@@ -1,19 +1,83 @@
 import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Union
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
-from google.cloud import bigquery
+import pyarrow as pa
+from google.cloud import bigquery, bigquery_storage
 from google.cloud.exceptions import NotFound
 
+# Maximum number of query parameters BigQuery accepts in a single query
+MAX_QUERY_PARAMETERS = 10_000
+
+# Legacy schema field types -> GoogleSQL query parameter types
+_PARAM_TYPES = {"INTEGER": "INT64", "FLOAT": "FLOAT64", "BOOLEAN": "BOOL"}
+
+
+@functools.lru_cache(maxsize=1024)
+def _table_ref(project: str, dataset_id: str, table_id: str) -> bigquery.TableReference:
+    """Build (once) the reference to a BigQuery table."""
+    return bigquery.TableReference.from_string(f"{project}.{dataset_id}.{table_id}")
+
+
+def _param_type(field: bigquery.SchemaField) -> str:
+    """Get the query parameter type matching a (scalar) schema field."""
+    if field.mode == "REPEATED" or field.field_type in ("RECORD", "STRUCT"):
+        raise TypeError(
+            f"Column {field.name} of type {field.mode} {field.field_type} "
+            "is not supported by insert_rows"
+        )
+    return _PARAM_TYPES.get(field.field_type, field.field_type)
+
+
+class PartialInsertError(Exception):
+    """Raised by insert_rows when an INSERT fails after earlier ones were committed."""
+
+    def __init__(self, message: str, inserted_rows: int):
+        super().__init__(message)
+        # Number of leading rows already committed, they must not be inserted again
+        self.inserted_rows = inserted_rows
+
 
 class GoogleBigQueryConnector:
     def __init__(
-        self, project_id: Optional[str] = None, logger: Optional[logging.Logger] = None
+        self,
+        project_id: Optional[str] = None,
+        logger: Optional[logging.Logger] = None,
+        cache_ttl_s: float = 60,
     ):
-        self.client = bigquery.Client(project=project_id)
+        self._project = project_id
+        self._client = None
+        self._bqstorage = None
+        # Job configs reused across calls, the client copies them before each job
+        self._load_configs = {
+            disposition: bigquery.LoadJobConfig(write_disposition=disposition)
+            for disposition in ("WRITE_TRUNCATE", "WRITE_APPEND", "WRITE_EMPTY")
+        }
+        self._empty_query_config = bigquery.QueryJobConfig()
+        # Tables seen to exist, with the time of the check (misses are never cached)
+        self.cache_ttl_s = cache_ttl_s
+        self._table_exists_cache: Dict[Tuple[str, str], float] = {}
+        # Table schemas used by insert_rows, as column name -> schema field
+        self._schema_cache: Dict[Tuple[str, str], Dict[str, bigquery.SchemaField]] = {}
         self.logger = logger or logging.getLogger(__name__)
 
+    @property
+    def client(self) -> bigquery.Client:
+        """The underlying client, created on first access."""
+        if self._client is None:
+            self._client = bigquery.Client(project=self._project)
+        return self._client
+
+    @property
+    def bqstorage(self) -> bigquery_storage.BigQueryReadClient:
+        """The BigQuery Storage read client, created on first access."""
+        if self._bqstorage is None:
+            self._bqstorage = bigquery_storage.BigQueryReadClient()
+        return self._bqstorage
+
     # Synchronous methods
     def execute_query(
         self, query: str, params: Optional[Dict[str, Any]] = None
@@ -28,9 +92,13 @@ class GoogleBigQueryConnector:
         self.logger.info(f"Executing BigQuery query: {query[:100]}...")
 
         try:
-            job_config = bigquery.QueryJobConfig(query_parameters=params or [])
+            job_config = (
+                bigquery.QueryJobConfig(query_parameters=params)
+                if params
+                else self._empty_query_config
+            )
             query_job = self.client.query(query, job_config=job_config)
-            result = query_job.to_dataframe()
+            result = query_job.to_dataframe(bqstorage_client=self.bqstorage)
 
             self.logger.info(
                 f"Successfully executed query, returned {len(result)} rows"
@@ -40,6 +108,35 @@ class GoogleBigQueryConnector:
             self.logger.error(f"Error executing BigQuery query: {str(e)}")
             raise
 
+    def execute_query_arrow(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> pa.Table:
+        """
+        Execute a BigQuery SQL query synchronously, keeping the results in Arrow format.
+
+        :param query: SQL query to execute
+        :param params: Optional query parameters
+        :return: Query results as a pyarrow Table
+        """
+        self.logger.info(f"Executing BigQuery query: {query[:100]}...")
+
+        try:
+            job_config = (
+                bigquery.QueryJobConfig(query_parameters=params)
+                if params
+                else self._empty_query_config
+            )
+            query_job = self.client.query(query, job_config=job_config)
+            result = query_job.to_arrow(bqstorage_client=self.bqstorage)
+
+            self.logger.info(
+                f"Successfully executed query, returned {result.num_rows} rows"
+            )
+            return result
+        except Exception as e:
+            self.logger.error(f"Error executing BigQuery query: {str(e)}")
+            raise
+
     def get_table_data(
         self, dataset_id: str, table_id: str, limit: Optional[int] = None
     ) -> pd.DataFrame:
@@ -75,9 +172,16 @@ class GoogleBigQueryConnector:
         """
         self.logger.info(f"Checking if table {dataset_id}.{table_id} exists")
 
+        key = (dataset_id, table_id)
+        seen_at = self._table_exists_cache.get(key)
+        if seen_at is not None and time.monotonic() - seen_at < self.cache_ttl_s:
+            self.logger.info(f"Table {dataset_id}.{table_id} exists (cached)")
+            return True
+
         try:
-            table_ref = self.client.dataset(dataset_id).table(table_id)
+            table_ref = _table_ref(self.client.project, dataset_id, table_id)
             self.client.get_table(table_ref)
+            self._table_exists_cache[key] = time.monotonic()
             self.logger.info(f"Table {dataset_id}.{table_id} exists")
             return True
         except NotFound:
@@ -102,7 +206,7 @@ class GoogleBigQueryConnector:
         self.logger.info(f"Creating table {dataset_id}.{table_id}")
 
         try:
-            table_ref = self.client.dataset(dataset_id).table(table_id)
+            table_ref = _table_ref(self.client.project, dataset_id, table_id)
             table = bigquery.Table(table_ref, schema=schema)
             self.client.create_table(table)
             self.logger.info(f"Successfully created table {dataset_id}.{table_id}")
@@ -128,10 +232,10 @@ class GoogleBigQueryConnector:
         self.logger.info(f"Uploading {len(dataframe)} rows to {dataset_id}.{table_id}")
 
         try:
-            table_ref = self.client.dataset(dataset_id).table(table_id)
-            job_config = bigquery.LoadJobConfig(
-                write_disposition=write_disposition,
-            )
+            table_ref = _table_ref(self.client.project, dataset_id, table_id)
+            job_config = self._load_configs.get(
+                write_disposition
+            ) or bigquery.LoadJobConfig(write_disposition=write_disposition)
 
             job = self.client.load_table_from_dataframe(
                 dataframe, table_ref, job_config=job_config
@@ -145,6 +249,137 @@ class GoogleBigQueryConnector:
             )
             raise
 
+    def insert_rows(
+        self,
+        dataset_id: str,
+        table_id: str,
+        rows: List[Dict[str, Any]],
+        batch_size: int = 500,
+    ) -> None:
+        """
+        Insert rows into a BigQuery table synchronously, using one multi-row INSERT per batch.
+
+        :param dataset_id: ID of the dataset
+        :param table_id: ID of the table
+        :param rows: Rows to insert, as dictionaries mapping column names to values
+        :param batch_size: Maximum number of rows per INSERT statement (lowered so that
+            each statement stays under the BigQuery limit of 10,000 query parameters)
+        :raises PartialInsertError: If an INSERT fails after earlier ones were committed
+        """
+        self.logger.info(f"Inserting {len(rows)} rows into {dataset_id}.{table_id}")
+
+        key = (dataset_id, table_id)
+        inserted_rows = 0
+        try:
+            columns = list(dict.fromkeys(column for row in rows for column in row))
+            if not columns:
+                self.logger.warning(
+                    f"No columns to insert into {dataset_id}.{table_id}, skipping"
+                )
+                return
+
+            # Parameter types come from the table schema, so that missing values and
+            # None become NULLs of the column type
+            fields = self._get_schema(dataset_id, table_id, columns)
+            unknown = [column for column in columns if column not in fields]
+            if unknown:
+                raise ValueError(
+                    f"Columns {unknown} not found in table {dataset_id}.{table_id}"
+                )
+            param_types = [_param_type(fields[column]) for column in columns]
+
+            step = max(1, min(batch_size, MAX_QUERY_PARAMETERS // len(columns)))
+            for start in range(0, len(rows), step):
+                batch = rows[start : start + step]
+
+                values = []
+                params = []
+                for i, row in enumerate(batch):
+                    placeholders = []
+                    for j, column in enumerate(columns):
+                        name = f"r{i}_c{j}"
+                        value = row.get(column)
+                        placeholders.append(f"@{name}")
+                        params.append(
+                            bigquery.ScalarQueryParameter(
+                                name, param_types[j], value
+                            )
+                        )
+                    values.append(f"({', '.join(placeholders)})")
+
+                query = (
+                    f"INSERT `{dataset_id}.{table_id}` "
+                    f"({', '.join(f'`{column}`' for column in columns)}) "
+                    f"VALUES {', '.join(values)}"
+                )
+                job_config = bigquery.QueryJobConfig(query_parameters=params)
+                self.client.query(query, job_config=job_config).result()
+                inserted_rows += len(batch)
+
+            self.logger.info(
+                f"Successfully inserted {len(rows)} rows into {dataset_id}.{table_id}"
+            )
+        except Exception as e:
+            # The schema may have changed, read it again on the next call
+            self._schema_cache.pop(key, None)
+            self.logger.error(
+                f"Error inserting rows into {dataset_id}.{table_id} "
+                f"({inserted_rows} of {len(rows)} rows already committed): {str(e)}"
+            )
+            if inserted_rows:
+                raise PartialInsertError(
+                    f"Only {inserted_rows} of {len(rows)} rows were inserted into "
+                    f"{dataset_id}.{table_id}: {str(e)}",
+                    inserted_rows,
+                ) from e
+            raise
+
+    def validate_rows(
+        self, dataset_id: str, table_id: str, rows: List[Dict[str, Any]]
+    ) -> List[Optional[Exception]]:
+        """
+        Check rows against the schema of a BigQuery table before calling insert_rows.
+
+        :param dataset_id: ID of the dataset
+        :param table_id: ID of the table
+        :param rows: Rows to check, as dictionaries mapping column names to values
+        :return: For each row, None if it can be inserted, otherwise its error
+        """
+        columns = list(dict.fromkeys(column for row in rows for column in row))
+        fields = self._get_schema(dataset_id, table_id, columns)
+
+        errors: List[Optional[Exception]] = []
+        for row in rows:
+            unknown = [column for column in row if column not in fields]
+            try:
+                if unknown:
+                    raise ValueError(
+                        f"Columns {unknown} not found in table {dataset_id}.{table_id}"
+                    )
+                for column in row:
+                    _param_type(fields[column])
+                errors.append(None)
+            except (TypeError, ValueError) as e:
+                errors.append(e)
+        return errors
+
+    def _get_schema(
+        self, dataset_id: str, table_id: str, columns: List[str]
+    ) -> Dict[str, bigquery.SchemaField]:
+        """
+        Helper method to get the (cached) schema of a table as column name -> field.
+        The schema is read again once if some of the columns are not in the cached one.
+        """
+        key = (dataset_id, table_id)
+        fields = self._schema_cache.get(key)
+        if fields is None or any(column not in fields for column in columns):
+            table = self.client.get_table(
+                _table_ref(self.client.project, dataset_id, table_id)
+            )
+            fields = {field.name: field for field in table.schema}
+            self._schema_cache[key] = fields
+        return fields
+
     # Asynchronous methods
     async def execute_query_async(
         self, query: str, params: Optional[Dict[str, Any]] = None
@@ -159,6 +394,19 @@ class GoogleBigQueryConnector:
         self.logger.info(f"Initiating async BigQuery query: {query[:100]}...")
         return await asyncio.to_thread(self.execute_query, query, params)
 
+    async def execute_query_arrow_async(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> pa.Table:
+        """
+        Execute a BigQuery SQL query asynchronously, keeping the results in Arrow format.
+
+        :param query: SQL query to execute
+        :param params: Optional query parameters
+        :return: Query results as a pyarrow Table
+        """
+        self.logger.info(f"Initiating async BigQuery query: {query[:100]}...")
+        return await asyncio.to_thread(self.execute_query_arrow, query, params)
+
     async def get_table_data_async(
         self, dataset_id: str, table_id: str, limit: Optional[int] = None
     ) -> pd.DataFrame:
@@ -223,6 +471,51 @@ class GoogleBigQueryConnector:
             self.upload_dataframe, dataset_id, table_id, dataframe, write_disposition
         )
 
+    async def insert_rows_async(
+        self,
+        dataset_id: str,
+        table_id: str,
+        rows: List[Dict[str, Any]],
+        batch_size: int = 500,
+    ) -> None:
+        """
+        Insert rows into a BigQuery table asynchronously, using one multi-row INSERT per batch.
+
+        :param dataset_id: ID of the dataset
+        :param table_id: ID of the table
+        :param rows: Rows to insert, as dictionaries mapping column names to values
+        :param batch_size: Maximum number of rows per INSERT statement (lowered so that
+            each statement stays under the BigQuery limit of 10,000 query parameters)
+        """
+        self.logger.info(
+            f"Initiating async insert of {len(rows)} rows into {dataset_id}.{table_id}"
+        )
+        await asyncio.to_thread(
+            self.insert_rows, dataset_id, table_id, rows, batch_size
+        )
+
+    async def validate_rows_async(
+        self, dataset_id: str, table_id: str, rows: List[Dict[str, Any]]
+    ) -> List[Optional[Exception]]:
+        """
+        Check rows against the schema of a BigQuery table asynchronously.
+
+        :param dataset_id: ID of the dataset
+        :param table_id: ID of the table
+        :param rows: Rows to check, as dictionaries mapping column names to values
+        :return: For each row, None if it can be inserted, otherwise its error
+        """
+        return await asyncio.to_thread(self.validate_rows, dataset_id, table_id, rows)
+
+
+# Singleton instance that can be imported elsewhere, created on first access
+_bigquery_connector: Optional[GoogleBigQueryConnector] = None
+
 
-# Create a singleton instance that can be imported elsewhere
-bigquery_connector = GoogleBigQueryConnector()
+def __getattr__(name: str):
+    global _bigquery_connector
+    if name == "bigquery_connector":
+        if _bigquery_connector is None:
+            _bigquery_connector = GoogleBigQueryConnector()
+        return _bigquery_connector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,27 +1,53 @@
 import asyncio
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 from google.api_core.exceptions import NotFound
 from google.cloud import storage
+from requests.adapters import HTTPAdapter
+
+# Maximum number of blobs downloaded in parallel by the folder downloads,
+# the HTTP connection pool of the client is sized accordingly
+GCS_CONCURRENCY = max(1, int(os.environ.get("GCS_CONCURRENCY", 32)))
 
 
 class GoogleStorageConnector:
     def __init__(
         self, project_id: Optional[str] = None, logger: Optional[logging.Logger] = None
     ):
-        self.client = storage.Client(project=project_id)
+        self._project = project_id
+        self._client = None
         self.logger = logger or logging.getLogger(__name__)
 
+    @property
+    def client(self) -> storage.Client:
+        """The underlying client, created on first access."""
+        if self._client is None:
+            self._client = storage.Client(project=self._project)
+            # Keep the adapters google-auth mounts for mTLS (HTTPAdapter subclasses)
+            session = self._client._http
+            if type(session.get_adapter("https://")) is HTTPAdapter:
+                session.mount("https://", HTTPAdapter(pool_maxsize=GCS_CONCURRENCY))
+        return self._client
+
     # Synchronous methods
-    def download_blob(self, bucket_name: str, blob_name: str) -> bytes:
+    def download_blob(
+        self,
+        bucket_name: str,
+        blob_name: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> bytes:
         """
         Download a blob from Google Cloud Storage synchronously.
 
         :param bucket_name: Name of the bucket
         :param blob_name: Name of the blob (file) to download
+        :param start: Optional first byte to download
+        :param end: Optional last byte to download (inclusive)
         :return: Content of the blob as bytes
         """
         self.logger.info(f"Downloading {blob_name} from {bucket_name}")
@@ -29,7 +55,7 @@ class GoogleStorageConnector:
         try:
             bucket = self.client.bucket(bucket_name)
             blob = bucket.blob(blob_name)
-            content = blob.download_as_bytes()
+            content = blob.download_as_bytes(start=start, end=end)
             self.logger.info(f"Successfully downloaded {blob_name} from {bucket_name}")
             return content
         except NotFound:
@@ -43,6 +69,37 @@ class GoogleStorageConnector:
             )
             raise
 
+    def download_blob_to_file(
+        self, bucket_name: str, blob_name: str, local_file_path: Union[str, Path]
+    ) -> None:
+        """
+        Download a blob from Google Cloud Storage to a local file synchronously,
+        streaming it to disk instead of holding it in memory.
+
+        :param bucket_name: Name of the bucket
+        :param blob_name: Name of the blob (file) to download
+        :param local_file_path: Path to the local file to write
+        """
+        self.logger.info(
+            f"Downloading {blob_name} from {bucket_name} to {local_file_path}"
+        )
+
+        try:
+            bucket = self.client.bucket(bucket_name)
+            blob = bucket.blob(blob_name)
+            blob.download_to_filename(local_file_path)
+            self.logger.info(f"Downloaded: {blob_name} -> {local_file_path}")
+        except NotFound:
+            self.logger.error(f"Blob {blob_name} not found in bucket {bucket_name}")
+            raise FileNotFoundError(
+                f"Blob {blob_name} not found in bucket {bucket_name}"
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Error downloading {blob_name} from {bucket_name}: {str(e)}"
+            )
+            raise
+
     def upload_blob(
         self,
         bucket_name: str,
@@ -115,26 +172,16 @@ class GoogleStorageConnector:
             # List all blobs in the GCS folder
             blobs = self.list_blobs(bucket_name, prefix=gcs_folder)
 
-            for blob_name in blobs:
-                # Ignore if the blob is a "folder" (ends with '/')
-                if blob_name.endswith("/"):
-                    continue
-
-                # Construct the local file path
-                relative_path = os.path.relpath(blob_name, gcs_folder)
-                local_file_path = os.path.join(local_folder, relative_path)
-
-                # Ensure local subdirectories exist
-                os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
+            targets = self._prepare_folder_targets(blobs, gcs_folder, local_folder)
 
-                # Download the blob content
-                content = self.download_blob(bucket_name, blob_name)
-
-                # Write the content to the local file
-                with open(local_file_path, "wb") as f:
-                    f.write(content)
-
-                self.logger.info(f"Downloaded: {blob_name} -> {local_file_path}")
+            # Download the blobs concurrently, each download releases the GIL on I/O
+            with ThreadPoolExecutor(max_workers=GCS_CONCURRENCY) as executor:
+                list(
+                    executor.map(
+                        lambda target: self.download_blob_to_file(bucket_name, *target),
+                        targets,
+                    )
+                )
 
         except Exception as e:
             self.logger.error(
@@ -142,17 +189,68 @@ class GoogleStorageConnector:
             )
             raise
 
+    @staticmethod
+    def _prepare_folder_targets(
+        blobs: List[str], gcs_folder: str, local_folder: str
+    ) -> List[Tuple[str, str]]:
+        """
+        Helper method to map the blobs of a GCS folder to local file paths, creating
+        each local subdirectory once.
+        """
+        # Construct the local file paths, ignoring "folders" (blobs ending with '/')
+        targets = [
+            (
+                blob_name,
+                os.path.join(local_folder, os.path.relpath(blob_name, gcs_folder)),
+            )
+            for blob_name in blobs
+            if not blob_name.endswith("/")
+        ]
+
+        # Ensure local subdirectories exist, once per directory
+        for directory in {os.path.dirname(path) for _, path in targets}:
+            os.makedirs(directory, exist_ok=True)
+
+        return targets
+
     # Asynchronous methods
-    async def download_blob_async(self, bucket_name: str, blob_name: str) -> bytes:
+    async def download_blob_async(
+        self,
+        bucket_name: str,
+        blob_name: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> bytes:
         """
         Download a blob from Google Cloud Storage asynchronously.
 
         :param bucket_name: Name of the bucket
         :param blob_name: Name of the blob (file) to download
+        :param start: Optional first byte to download
+        :param end: Optional last byte to download (inclusive)
         :return: Content of the blob as bytes
         """
         self.logger.info(f"Initiating async download of {blob_name} from {bucket_name}")
-        return await asyncio.to_thread(self.download_blob, bucket_name, blob_name)
+        return await asyncio.to_thread(
+            self.download_blob, bucket_name, blob_name, start, end
+        )
+
+    async def download_blob_to_file_async(
+        self, bucket_name: str, blob_name: str, local_file_path: Union[str, Path]
+    ) -> None:
+        """
+        Download a blob from Google Cloud Storage to a local file asynchronously.
+
+        :param bucket_name: Name of the bucket
+        :param blob_name: Name of the blob (file) to download
+        :param local_file_path: Path to the local file to write
+        """
+        self.logger.info(
+            f"Initiating async download of {blob_name} from {bucket_name} to {local_file_path}"
+        )
+        await asyncio.to_thread(
+            self.download_blob_to_file, bucket_name, blob_name, local_file_path
+        )
 
     async def upload_blob_async(
         self,
@@ -208,23 +306,16 @@ class GoogleStorageConnector:
             # List all blobs in the GCS folder
             blobs = await self.list_blobs_async(bucket_name, prefix=gcs_folder)
 
-            # Create a list of download tasks
-            download_tasks = []
-            for blob_name in blobs:
-                # Ignore if the blob is a "folder" (ends with '/')
-                if blob_name.endswith("/"):
-                    continue
+            targets = self._prepare_folder_targets(blobs, gcs_folder, local_folder)
 
-                # Construct the local file path
-                relative_path = os.path.relpath(blob_name, gcs_folder)
-                local_file_path = os.path.join(local_folder, relative_path)
-
-                # Ensure local subdirectories exist
-                os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
-
-                # Create download task
-                task = self._download_and_save(bucket_name, blob_name, local_file_path)
-                download_tasks.append(task)
+            # Create a list of download tasks, at most GCS_CONCURRENCY run at once
+            semaphore = asyncio.Semaphore(GCS_CONCURRENCY)
+            download_tasks = [
+                self._download_and_save(
+                    bucket_name, blob_name, local_file_path, semaphore
+                )
+                for blob_name, local_file_path in targets
+            ]
 
             # Execute all downloads concurrently
             await asyncio.gather(*download_tasks)
@@ -237,17 +328,27 @@ class GoogleStorageConnector:
             raise
 
     async def _download_and_save(
-        self, bucket_name: str, blob_name: str, local_file_path: str
+        self,
+        bucket_name: str,
+        blob_name: str,
+        local_file_path: str,
+        semaphore: asyncio.Semaphore,
     ) -> None:
         """Helper method to download a blob and save it to a local path."""
-        content = await self.download_blob_async(bucket_name, blob_name)
+        async with semaphore:
+            await self.download_blob_to_file_async(
+                bucket_name, blob_name, local_file_path
+            )
 
-        # Write the content to the local file
-        with open(local_file_path, "wb") as f:
-            f.write(content)
 
-        self.logger.info(f"Downloaded: {blob_name} -> {local_file_path}")
+# Singleton instance that can be imported elsewhere, created on first access
+_storage_connector: Optional[GoogleStorageConnector] = None
 
 
-# Create a singleton instance that can be imported elsewhere
-storage_connector = GoogleStorageConnector()
+def __getattr__(name: str):
+    global _storage_connector
+    if name == "storage_connector":
+        if _storage_connector is None:
+            _storage_connector = GoogleStorageConnector()
+        return _storage_connector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
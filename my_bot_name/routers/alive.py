@@ -1,14 +1,15 @@
 from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
 
 router = APIRouter(tags=["alive"])
 
 
-@router.get("/ping", status_code=status.HTTP_200_OK)
+@router.get("/ping", status_code=status.HTTP_200_OK, response_class=PlainTextResponse)
 async def ping():
     """
     Ping endpoint.
 
     Returns:
-        str: A string response indicating the alive status.
+        PlainTextResponse: A plain text response indicating the alive status.
     """
-    return "Alive"
+    return PlainTextResponse("Alive")
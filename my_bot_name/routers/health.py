@@ -6,7 +6,7 @@ router = APIRouter(
 )
 
 
-@router.get("/health", status_code=status.HTTP_200_OK, response_model=dict)
+@router.get("/health", status_code=status.HTTP_200_OK)
 async def health_check():
     """
     Health check endpoint.
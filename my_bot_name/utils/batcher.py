@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Set
+
+_STOP = object()
+
+
+class Batcher:
+    """
+    Coalesce items submitted by concurrent requests into one downstream call per batch.
+
+    A batch is flushed when it holds max_batch items or max_wait_ms after its first
+    item arrived, whichever comes first: max_wait_ms is the extra latency a request
+    may pay in exchange for fewer, larger downstream calls. Up to max_concurrency
+    batches are flushed at the same time, later batches wait for a free slot.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[List[Any]], Awaitable[Optional[List[Any]]]],
+        max_batch: int = 32,
+        max_wait_ms: int = 50,
+        max_concurrency: int = 4,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        :param fn: Coroutine function called with the items of a batch; it may return a
+            list with one result per item, handed back to the submitters (an exception
+            in the list is raised to its submitter only)
+        :param max_batch: Maximum number of items per batch
+        :param max_wait_ms: Maximum time in milliseconds an item waits for its batch
+        :param max_concurrency: Maximum number of batches flushed at the same time
+        :param logger: Optional logger
+        """
+        self.fn = fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.max_concurrency = max(1, max_concurrency)
+        self.logger = logger or logging.getLogger(__name__)
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Start the background task flushing the batches."""
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush the pending items and stop the background task."""
+        if self._task is not None:
+            await self._queue.put(_STOP)
+            await self._task
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+            self._task = None
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Add an item to the current batch and wait for the batch to be flushed.
+
+        :param item: Item to pass to the batch function
+        :return: The result for this item, if the batch function returned any
+        """
+        if self._task is None:
+            raise RuntimeError("Batcher is not started")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            entry = await self._queue.get()
+            if entry is _STOP:
+                break
+
+            batch = [entry]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            # Flush in the background so the next batch can be collected meanwhile
+            task = asyncio.create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[tuple]) -> None:
+        items = [item for item, _ in batch]
+        futures = [future for _, future in batch]
+
+        try:
+            async with self._semaphore:
+                results = await self.fn(items)
+            if results is None:
+                results = [None] * len(items)
+            elif len(results) != len(items):
+                raise ValueError(
+                    f"Batch function returned {len(results)} results "
+                    f"for {len(items)} items"
+                )
+        except asyncio.CancelledError:
+            for future in futures:
+                future.cancel()
+            raise
+        except BaseException as e:
+            self.logger.error(f"Error flushing batch of {len(items)} items: {str(e)}")
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for future, result in zip(futures, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
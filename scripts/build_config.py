@@ -0,0 +1,27 @@
+"""
+Compile the YAML config files into JSON files next to them.
+The package loads the JSON files in place of the YAML ones, which are slower to parse.
+
+Usage: python scripts/build_config.py [config_dir]
+"""
+import sys
+from pathlib import Path
+
+import orjson
+import yaml
+
+CONFIG_LOCATION = Path(__file__).parent.parent / "my_bot_name" / "resources" / "config"
+
+
+def build_config(config_location: Path = CONFIG_LOCATION) -> None:
+    """Write a .json file for every .yml file in the config folder"""
+    for yml_path in sorted(config_location.glob("*.yml")):
+        with open(yml_path) as f:
+            data = yaml.safe_load(f) or {}
+        json_path = yml_path.with_suffix(".json")
+        json_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        print(f"{yml_path.name} -> {json_path.name}")
+
+
+if __name__ == "__main__":
+    build_config(Path(sys.argv[1]) if len(sys.argv) > 1 else CONFIG_LOCATION)